@@ -1 +1 @@
-from .plotdf import getWorkbook, writeData, addSeries, plotBarChart, plotColumnChart, plotLineChart, addScatterSeries, plotScatterChart, plotHistogram
+from .plotdf import getWorkbook, writeData, addSeries, plotBarChart, plotColumnChart, plotLineChart, addScatterSeries, plotScatterChart, plotHistogram, plotDashboard
@@ -55,11 +55,155 @@ def __getLocation(df, kwargs):
         cell = xl_rowcol_to_cell(2, len(df.columns) + 3) 
     return cell
 
+def __roundSignificant(values, digits):
+    """Round an array of floats to the given number of significant digits"""
+    values = np.asarray(values, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        mag = np.floor(np.log10(np.abs(values)))
+        mag[~np.isfinite(mag)] = 0
+        scale = 10.0 ** (digits - 1 - mag)
+        rounded = np.round(values * scale) / scale
+    return np.where(np.isfinite(rounded), rounded, values)
+
+def __getPrecision(col, setting):
+    if isinstance(setting, dict):
+        return setting.get(col)
+    return setting
+
+def __roundData(df, kwargs):
+    """Round float columns according to the decimals/sig_digits options
+       Returns the rounded DataFrame and a dict of column position to number format
+    """
+    decimals = kwargs.get('decimals')
+    sig_digits = kwargs.get('sig_digits')
+    num_formats = {}
+    if decimals is None and sig_digits is None:
+        return df, num_formats
+    df = df.copy()
+    for idx, col in enumerate(df.columns):
+        if df.dtypes.iloc[idx].kind != 'f':
+            continue
+        ndec = __getPrecision(col, decimals)
+        nsig = __getPrecision(col, sig_digits)
+        # Round in float64, float32 values would be written with all their binary noise digits
+        values = df.iloc[:, idx].values.astype(np.float64)
+        if ndec is not None:
+            df.isetitem(idx, np.round(values, ndec))
+            num_formats[idx] = '0.' + '0' * ndec if ndec > 0 else '0'
+        elif nsig is not None:
+            df.isetitem(idx, __roundSignificant(values, nsig))
+    return df, num_formats
+
 def __addQuotes(name):
     if not name.isalnum():
         return "'" + name + "'"
     return name
 
+def __scatterData(df, pairs, kwargs):
+    """Combine the inputs of plotScatterChart into a single DataFrame and dict of pairs"""
+    if isinstance(df, pandas.Series) and isinstance(pairs, pandas.Series):
+        df = df.to_frame()
+        df2 = pairs.to_frame()
+        if df2.columns[0] == 0:
+            df2.columns = [1] 
+        df = pandas.concat([df, df2], axis=1)
+        origlen = len(df.index)
+        df = df.dropna()
+        newlen = len(df.index)
+        if newlen != origlen:
+            print('Dropped', origlen - newlen, 'rows due to missing values')
+        df.columns = [str(x) for x in df.columns]
+        pairs = {'data': (df.columns[0], df.columns[1])} 
+    elif isinstance(df, pandas.DataFrame):
+        if pairs is None:
+            if len(df.columns) != 2:
+                raise Exception('Pairs cannot be None if DataFrame has more than 2 columns')
+            pairs = {'data': (df.columns[0], df.columns[1])}
+    if len(pairs) == 1:
+        pair = list(pairs.values())[0]
+        if 'x_title' not in kwargs:
+            kwargs['x_title'] = pair[0]
+        if 'y_title' not in kwargs:
+            kwargs['y_title'] = pair[1]
+    if 'sortonx' in kwargs and kwargs['sortonx']:
+        df = __sortDF(df, pairs)
+    pairs = pairs.copy()
+    if 'reference' in kwargs and kwargs['reference'] is not None:
+        df, pairs = __addReference(df, pairs, kwargs['reference'])
+    return df, pairs
+
+def __histogramData(df, kwargs):
+    """Return DataFrame of bin counts per column, using the same bins for all columns"""
+    alldata = df.values.flatten()
+    alldata = alldata[~np.isnan(alldata)]
+    if 'bins' in kwargs:
+        h, b = np.histogram(alldata, bins=kwargs['bins'])
+    else:
+        h, b = np.histogram(alldata)
+    bins = b
+    bindf = {}
+    for colname, data in df.items():
+        data = data.dropna().values
+        h, b = np.histogram(data, bins=bins)
+        bindf[colname] = pandas.Series(h, index=[x for x in b[:-1]])
+    return pandas.DataFrame(bindf)
+
+def __makeChart(kind, df, pairs, wb, sheetname, kwargs):
+    """Create a chart of the given kind for data already written to sheetname"""
+    params = {'type': 'column' if kind == 'histogram' else kind}
+    if 'subtype' in kwargs:
+        params['subtype'] = kwargs['subtype']
+    chart = wb.add_chart(params)
+    __addAxisInfo(chart, kwargs)
+    if kind == 'scatter':
+        addScatterSeries(df, pairs, chart, sheetname, **kwargs)
+    elif kind == 'histogram':
+        addSeries(df, chart, sheetname, **dict(kwargs, gap=0))
+    else:
+        addSeries(df, chart, sheetname, **kwargs)
+
+    #Handle subtype here, since it is not actually an Xlsxwriter option for line charts
+    if kind == 'line' and 'subtype' in kwargs:
+        subtype = kwargs['subtype']
+        if 'marker' in subtype:
+            # Go through each series and define default values.
+            for series in chart.series:
+                # Set a marker type unless there is a user defined type.
+                series['marker'] = {'type': 'automatic',
+                                    'automatic': True,
+                                    'defined': True,
+                                    'line': {'defined': False},
+                                    'fill': {'defined': False}
+                                    }
+
+        # Turn on smoothing if required
+        if 'smooth' in subtype:
+            for series in chart.series:
+                series['smooth'] = True
+
+        if subtype == 'marker_only':
+            for series in chart.series:
+                series['line'] = {'width': 2.25,
+                                  'none': 1,
+                                  'defined': True,
+                                  }
+
+    return chart
+
+def __getScale(kind, df, kwargs):
+    """Return (x_scale, y_scale) for a dashboard chart, growing with the number of points shown"""
+    if kind in ('line', 'scatter'):
+        npoints = len(df.index) / 50.0
+    else:
+        npoints = len(df.index) * len(df.columns) / 20.0
+    scale = min(2.0, max(1.0, npoints))
+    if kind == 'bar':
+        # Horizontal bars need the extra room vertically
+        default = (1.0 + (scale - 1.0) / 2, scale)
+    else:
+        default = (scale, 1.0 + (scale - 1.0) / 2)
+    return kwargs.get('x_scale', default[0]), kwargs.get('y_scale', default[1])
+
 def getWorkbook(fname, options=None):
     """Return a xlsxwriter Workbook by the given name"""
     if options is not None:
@@ -77,24 +221,43 @@ def writeData(df, wb, sheetname, **kwargs):
     sheetname: : string
         Name of sheet to which data and plot should be written
 
+    Other parameters
+    ----------------
+    decimals : int or dict, optional
+        Round float columns to this many decimal places and display them with a matching number format.
+        A dict maps column names to decimal places, columns not in the dict are left untouched.
+    sig_digits : int or dict, optional
+        Round float columns to this many significant digits, either for all columns or per column
+        via a dict.  Ignored for columns that also have decimals set.
+
     """
     worksheet = wb.add_worksheet(sheetname)
+    __writeFrame(df, wb, worksheet, 0, kwargs)
+    return worksheet
+
+def __writeFrame(df, wb, worksheet, startcol, kwargs):
+    """Write DataFrame to the given worksheet with its index in column startcol"""
+    df, num_formats = __roundData(df, kwargs)
     date_format = wb.add_format({'num_format': 'yyyy-mm-dd'}) 
     bold = wb.add_format({'bold': 1})
 
+    formats = {}
+    for idx, num_format in num_formats.items():
+        if num_format not in formats:
+            formats[num_format] = wb.add_format({'num_format': num_format})
+        worksheet.set_column(startcol+idx+1, startcol+idx+1, None, formats[num_format])
+
     if isinstance(df.columns, pandas.DatetimeIndex):
-        worksheet.write_row('B1', df.columns, date_format)
+        worksheet.write_row(0, startcol+1, df.columns, date_format)
     else:
-        worksheet.write_row('B1', df.columns, bold)
+        worksheet.write_row(0, startcol+1, df.columns, bold)
 
     for idx, (name, data) in enumerate(df.iterrows()):
         if isinstance(name, datetime.date):
-            worksheet.write(idx+1,0,name, date_format)
+            worksheet.write(idx+1, startcol, name, date_format)
         else:
-            worksheet.write(idx+1,0,name, bold)
-        worksheet.write_row('B' + str(idx+2), data)
-
-    return worksheet
+            worksheet.write(idx+1, startcol, name, bold)
+        worksheet.write_row(idx+1, startcol+1, data)
 
 def addSeries(df, chart, sheetname, **kwargs):
     if 'title' in kwargs:
@@ -102,13 +265,14 @@ def addSeries(df, chart, sheetname, **kwargs):
     secondaries = set()
     if 'secondary_y' in kwargs:
         secondaries = set(kwargs['secondary_y'])
+    startcol = kwargs.get('startcol', 0)
     for idx, col in enumerate(df.columns):
-        namecell = xl_rowcol_to_cell(0,idx+1)
+        namecell = xl_rowcol_to_cell(0,startcol+idx+1)
         info = {
             # 'name':       '=%s!%s' % (sheetname, namecell),
-            'name':       [__addQuotes(sheetname), 0, idx+1],
-            'categories': [__addQuotes(sheetname), 1, 0, len(df.index), 0],
-            'values':     [__addQuotes(sheetname), 1, idx+1, len(df.index), idx+1]
+            'name':       [__addQuotes(sheetname), 0, startcol+idx+1],
+            'categories': [__addQuotes(sheetname), 1, startcol, len(df.index), startcol],
+            'values':     [__addQuotes(sheetname), 1, startcol+idx+1, len(df.index), startcol+idx+1]
         }
         if col in secondaries:
             info['y2_axis'] = 1
@@ -141,15 +305,12 @@ def plotBarChart(df, wb, sheetname, **kwargs):
         Used to set the style of the chart to one of the 48 built-in styles available on the Design tab in Excel
     loc : (int, int) tuple, optional
         Row and column number where to locate the plot, if not specified the plot is placed to the right of the data
+    decimals, sig_digits : int or dict, optional
+        Rounding applied to the data before it is written, see writeData
 
     """
     worksheet = writeData(df, wb, sheetname, **kwargs)
-    params = {'type': 'bar'}
-    if 'subtype' in kwargs:
-        params['subtype'] = kwargs['subtype']
-    chart = wb.add_chart(params)
-    __addAxisInfo(chart, kwargs)
-    addSeries(df, chart, sheetname, **kwargs)
+    chart = __makeChart('bar', df, None, wb, sheetname, kwargs)
     # Insert the chart into the worksheet (with an offset).
     cell = __getLocation(df, kwargs)
     worksheet.insert_chart(cell, chart, {'x_scale': 2.0, 'y_scale': 2.0})
@@ -175,15 +336,12 @@ def plotColumnChart(df, wb, sheetname, **kwargs):
         Used to set the style of the chart to one of the 48 built-in styles available on the Design tab in Excel
     loc : (int, int) tuple, optional
         Row and column number where to locate the plot, if not specified the plot is placed to the right of the data
+    decimals, sig_digits : int or dict, optional
+        Rounding applied to the data before it is written, see writeData
 
     """
     worksheet = writeData(df, wb, sheetname, **kwargs)
-    params = {'type': 'column'}
-    if 'subtype' in kwargs:
-        params['subtype'] = kwargs['subtype']
-    chart = wb.add_chart(params)
-    __addAxisInfo(chart, kwargs)
-    addSeries(df, chart, sheetname, **kwargs)
+    chart = __makeChart('column', df, None, wb, sheetname, kwargs)
     # Insert the chart into the worksheet (with an offset).
     cell = __getLocation(df, kwargs)
     worksheet.insert_chart(cell, chart, {'x_scale': 2.0, 'y_scale': 2.0})
@@ -209,43 +367,14 @@ def plotLineChart(df, wb, sheetname, **kwargs):
         Used to set the style of the chart to one of the 48 built-in styles available on the Design tab in Excel
     loc : (int, int) tuple, optional
         Row and column number where to locate the plot, if not specified the plot is placed to the right of the data
+    decimals, sig_digits : int or dict, optional
+        Rounding applied to the data before it is written, see writeData
     secondary_y : iterable, optional
         list of columns whose scale goes on the secondary y-axis
 
     """
     worksheet = writeData(df, wb, sheetname, **kwargs)
-    params = {'type': 'line'}
-    if 'subtype' in kwargs:
-        params['subtype'] = kwargs['subtype']
-    chart = wb.add_chart(params)
-    __addAxisInfo(chart, kwargs)
-    addSeries(df, chart, sheetname, **kwargs)
-
-    #Handle subtype here, since it is not actually an Xlsxwriter option for line charts
-    if 'subtype' in kwargs:
-        subtype = kwargs['subtype']
-        if 'marker' in subtype:
-            # Go through each series and define default values.
-            for series in chart.series:
-                # Set a marker type unless there is a user defined type.
-                series['marker'] = {'type': 'automatic',
-                                    'automatic': True,
-                                    'defined': True,
-                                    'line': {'defined': False},
-                                    'fill': {'defined': False}
-                                    }
-
-        # Turn on smoothing if required
-        if 'smooth' in subtype:
-            for series in chart.series:
-                series['smooth'] = True
-
-        if subtype == 'marker_only':
-            for series in chart.series:
-                series['line'] = {'width': 2.25,
-                                  'none': 1,
-                                  'defined': True,
-                                  }
+    chart = __makeChart('line', df, None, wb, sheetname, kwargs)
 
     # Insert the chart into the worksheet (with an offset).
     cell = __getLocation(df, kwargs)
@@ -254,7 +383,8 @@ def plotLineChart(df, wb, sheetname, **kwargs):
 def addScatterSeries(df, pairs, chart, sheetname, **kwargs):
     if 'title' in kwargs:
         chart.set_title({'name': kwargs['title']})
-    name2idx = dict((c,idx) for idx, c in enumerate(df.columns))
+    startcol = kwargs.get('startcol', 0)
+    name2idx = dict((c,startcol+idx) for idx, c in enumerate(df.columns))
     cols = sorted(x for x in pairs.keys() if x != 'Reference')
     if 'Reference' in pairs:
         cols = cols + ['Reference']
@@ -301,6 +431,8 @@ def plotScatterChart(df, pairs, wb, sheetname, **kwargs):
         Used to set the style of the chart to one of the 48 built-in styles available on the Design tab in Excel
     loc : (int, int) tuple, optional
         Row and column number where to locate the plot, if not specified the plot is placed to the right of the data
+    decimals, sig_digits : int or dict, optional
+        Rounding applied to the data before it is written, see writeData
     sortonx : boolean, optional (default: False)
         Sort the pairs on the x values for nicer lines.  This will only include data to be plotted in the sheet.
     reference : callable, option (default: None)
@@ -308,44 +440,10 @@ def plotScatterChart(df, pairs, wb, sheetname, **kwargs):
         and return a float
 
     """
-    if isinstance(df, pandas.Series) and isinstance(pairs, pandas.Series):
-        df = df.to_frame()
-        df2 = pairs.to_frame()
-        if df2.columns[0] == 0:
-            df2.columns = [1] 
-        df = pandas.concat([df, df2], axis=1)
-        origlen = len(df.index)
-        df = df.dropna()
-        newlen = len(df.index)
-        if newlen != origlen:
-            print('Dropped', origlen - newlen, 'rows due to missing values')
-        df.columns = [str(x) for x in df.columns]
-        pairs = {'data': (df.columns[0], df.columns[1])} 
-    elif isinstance(df, pandas.DataFrame):
-        if pairs is None:
-            if len(df.columns) != 2:
-                raise Exception('Pairs cannot be None if DataFrame has more than 2 columns')
-            pairs = {'data': (df.columns[0], df.columns[1])}
-    if len(pairs) == 1:
-        pair = list(pairs.values())[0]
-        if 'x_title' not in kwargs:
-            kwargs['x_title'] = pair[0]
-        if 'y_title' not in kwargs:
-            kwargs['y_title'] = pair[1]
-    if 'sortonx' in kwargs and kwargs['sortonx']:
-        df = __sortDF(df, pairs)
-    pairs = pairs.copy()
-    if 'reference' in kwargs and kwargs['reference'] is not None:
-        df, pairs = __addReference(df, pairs, kwargs['reference'])
-
+    df, pairs = __scatterData(df, pairs, kwargs)
     worksheet = writeData(df, wb, sheetname, **kwargs)
-    params = {'type': 'scatter'}
-    if 'subtype' in kwargs:
-        params['subtype'] = kwargs['subtype']
-    chart = wb.add_chart(params)
-    __addAxisInfo(chart, kwargs)
-    addScatterSeries(df, pairs, chart, sheetname, **kwargs)
-    
+    chart = __makeChart('scatter', df, pairs, wb, sheetname, kwargs)
+
     # Insert the chart into the worksheet (with an offset).
     cell = __getLocation(df, kwargs)
     worksheet.insert_chart(cell, chart, {'x_scale': 2.0, 'y_scale': 2.0})
@@ -370,33 +468,106 @@ def plotHistogram(df, wb, sheetname, **kwargs):
         Used to set the style of the chart to one of the 48 built-in styles available on the Design tab in Excel
     loc : (int, int) tuple, optional
         Row and column number where to locate the plot, if not specified the plot is placed to the right of the data
+    decimals, sig_digits : int or dict, optional
+        Rounding applied to the data before it is written, see writeData
 
     """
-    alldata = df.values.flatten()
-    alldata = alldata[~np.isnan(alldata)]
-    if 'bins' in kwargs:
-        h, b = np.histogram(alldata, bins=kwargs['bin'])
-    else:
-        h, b = np.histogram(alldata)
-    bins = b
-    bindf = {}
-    for colname, data in df.items():
-        data = data.dropna().values
-        h, b = np.histogram(data, bins=bins)
-        bindf[colname] = pandas.Series(h, index=[x for x in b[:-1]])
-    df = pandas.DataFrame(bindf)
+    df = __histogramData(df, kwargs)
     worksheet = writeData(df, wb, sheetname, **kwargs)
-    params = {'type': 'column'}
-    if 'subtype' in kwargs:
-        params['subtype'] = kwargs['subtype']
-    chart = wb.add_chart(params)
-    __addAxisInfo(chart, kwargs)
-    kwargs['gap'] = 0
-    addSeries(df, chart, sheetname, **kwargs)
+    chart = __makeChart('histogram', df, None, wb, sheetname, kwargs)
     # Insert the chart into the worksheet (with an offset).
     cell = __getLocation(df, kwargs)
     worksheet.insert_chart(cell, chart, {'x_scale': 2.0, 'y_scale': 2.0})
 
+__DASHBOARD_KINDS = ('bar', 'column', 'line', 'scatter', 'histogram')
+
+def plotDashboard(charts, wb, sheetname, **kwargs):
+    """Place several charts in a grid on a single sheet
+
+    The data of all charts is written once, side by side, to a hidden data sheet.  Charts
+    created from the same DataFrame object share the same cells.
+
+    Parameters
+    ----------
+    charts : list of dict
+        One dict per chart.  'kind' is one of 'bar', 'column', 'line', 'scatter' or 'histogram'
+        and 'df' holds the data, scatter charts also take 'pairs'.  All other entries are passed
+        on as the other parameters of the matching plot function, e.g. title, subtype or style.
+    wb : xlsxwriter.Workbook
+    sheetname: : string
+        Name of sheet on which the charts are placed
+
+    Other parameters
+    ----------------
+    ncols : int, optional
+        Number of charts per row of the grid, defaults to the square root of the number of charts
+    datasheet : string, optional
+        Name of the hidden sheet holding the data, defaults to sheetname followed by ' data',
+        shortened to fit the 31 character limit on sheet names
+    decimals, sig_digits : int or dict, optional
+        Rounding applied to the data before it is written, see writeData.  Entries in a chart dict
+        take precedence, for a DataFrame shared by several charts the first chart's setting is used.
+    x_scale, y_scale : float, optional
+        Per chart entries that override the chart size, which otherwise grows with the amount of data
+
+    """
+    if len(charts) == 0:
+        raise ValueError('No charts given for dashboard')
+    for info in charts:
+        if info.get('kind') not in __DASHBOARD_KINDS:
+            raise ValueError('Unknown chart kind %r, expected one of %s' % (info.get('kind'), ', '.join(__DASHBOARD_KINDS)))
+    if 'ncols' in kwargs:
+        ncols = kwargs['ncols']
+        if ncols < 1:
+            raise ValueError('ncols must be at least 1, got %r' % (ncols,))
+    else:
+        ncols = int(np.ceil(np.sqrt(len(charts))))
+    datasheet = kwargs.get('datasheet', sheetname[:26] + ' data')
+
+    dashboard = wb.add_worksheet(sheetname)
+    data = wb.add_worksheet(datasheet)
+    dashboard.activate()
+    data.hide()
+
+    written = {}
+    startcol = 0
+    placed = []
+    for info in charts:
+        info = dict(info)
+        kind = info.pop('kind')
+        df = info.pop('df')
+        pairs = info.pop('pairs', None)
+        if kind == 'scatter':
+            df, pairs = __scatterData(df, pairs, info)
+        elif kind == 'histogram':
+            df = __histogramData(df, info)
+        if id(df) not in written:
+            rounding = dict((k, info.get(k, kwargs.get(k))) for k in ('decimals', 'sig_digits'))
+            __writeFrame(df, wb, data, startcol, rounding)
+            written[id(df)] = (startcol, df)
+            startcol += len(df.columns) + 1
+        info['startcol'] = written[id(df)][0]
+        chart = __makeChart(kind, df, pairs, wb, datasheet, info)
+        placed.append((chart, __getScale(kind, df, info)))
+
+    nrows = int(np.ceil(len(placed) / float(ncols)))
+    # Default xlsxwriter chart size in pixels, plus a margin between charts
+    width, height, margin = 480, 288, 10
+    colwidths = [0] * ncols
+    rowheights = [0] * nrows
+    for idx, (chart, (x_scale, y_scale)) in enumerate(placed):
+        row, col = divmod(idx, ncols)
+        colwidths[col] = max(colwidths[col], int(width * x_scale) + margin)
+        rowheights[row] = max(rowheights[row], int(height * y_scale) + margin)
+    xoffsets = np.cumsum([margin] + colwidths[:-1])
+    yoffsets = np.cumsum([margin] + rowheights[:-1])
+    for idx, (chart, (x_scale, y_scale)) in enumerate(placed):
+        row, col = divmod(idx, ncols)
+        dashboard.insert_chart('A1', chart, {'x_offset': int(xoffsets[col]), 'y_offset': int(yoffsets[row]),
+                                             'x_scale': x_scale, 'y_scale': y_scale})
+
+    return dashboard
+
 if __name__ == "__main__":
     wb = Workbook('test.xlsx')
     df = pandas.DataFrame.from_csv('test_dates.csv')